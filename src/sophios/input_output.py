@@ -1,15 +1,22 @@
 import argparse
+from collections import deque
 import copy
+import functools
 import json
-from pathlib import Path
+import os
+from pathlib import Path, PurePath
 import sys
-from typing import Any, List, Tuple
+from typing import Any, Deque, Dict, List, Set, Tuple, Union
 
 import yaml
 
 from . import auto_gen_header
 from .wic_types import (Namespaces, NodeData, RoseTree, Yaml, ExplicitEdgeCalls, Json)
 
+# Use large (128 KiB) file buffers so that dumping large compiled CWL files
+# doesn't result in many small write() syscalls.
+BUFFER_SIZE = 1 << 17
+
 
 def read_lines_pairs(filename: Path) -> List[Tuple[str, str]]:
     """Reads a whitespace-delimited file containing two paired entries per line (i.e. a serialized Dict).
@@ -23,18 +30,20 @@ def read_lines_pairs(filename: Path) -> List[Tuple[str, str]]:
     Returns:
         List[Tuple[str, str]]: The file contents, with blank lines and comments removed.
     """
-    with open(filename, mode='r', encoding='utf-8') as f:
-        lines = []
-        for line in f.readlines():
+    with open(filename, mode='r', encoding='utf-8', buffering=BUFFER_SIZE) as f:
+        lines: List[Tuple[str, str]] = []
+        append = lines.append
+        for line in f:  # Stream lines instead of materializing f.readlines()
             if line.strip() == '':  # Skip blank lines
                 continue
             if line.startswith('#'):  # Skip comment lines
                 continue
-            l_s = line.split()
+            # At most 3 fields are needed to detect lines with too many entries.
+            l_s = line.split(None, 2)
             if not len(l_s) == 2:
                 print(line)
                 raise Exception("Error! Line must contain exactly two entries!")
-            lines.append((l_s[0], l_s[1]))
+            append((l_s[0], l_s[1]))
     return lines
 
 
@@ -44,12 +53,36 @@ def read_lines_pairs(filename: Path) -> List[Tuple[str, str]]:
 # Solution: Inline the contents of the aliases into the anchors.
 # See https://ttl255.com/yaml-anchors-and-aliases-and-how-to-disable-them/#override
 
+# Prefer the libyaml C emitter (much faster for large compiled CWL files),
+# but fall back to the pure-Python emitter if PyYAML was built without libyaml.
+# NOTE: The two emitters wrap long (double-quoted) scalars differently, so the
+# exact text of the generated files depends on whether PyYAML was built with
+# libyaml. The parsed data is identical either way.
+try:
+    from yaml import CSafeDumper as _BaseDumper
+except ImportError:
+    from yaml import SafeDumper as _BaseDumper  # type: ignore[assignment]
+
 
-class NoAliasDumper(yaml.SafeDumper):
+class NoAliasDumper(_BaseDumper):  # pylint: disable=too-many-ancestors
     def ignore_aliases(self, data: Any) -> bool:
         return True
 
 
+# Shared arguments for every yaml.dump call in _write_node_to_disk.
+# Use sort_keys=False to preserve the order of the steps.
+# NOTE: Both PyYAML and libyaml already default to '\n' line breaks on all
+# platforms, so there is no need to pass line_break='\n'.
+# Use encoding='utf-8' so the emitter writes bytes directly into binary files,
+# skipping the per-write encoding step of a text mode file.
+_DUMPER_KWARGS: Dict[str, Any] = {'Dumper': NoAliasDumper, 'sort_keys': False,
+                                  'indent': 2, 'default_flow_style': False, 'encoding': 'utf-8'}
+
+# Pre-concatenate the file headers so each file only needs a single header write.
+_CWL_PREAMBLE = ('#!/usr/bin/env cwl-runner\n' + auto_gen_header).encode('utf-8')
+_YML_PREAMBLE = auto_gen_header.encode('utf-8')
+
+
 def write_to_disk(rose_tree: RoseTree, path: Path, relative_run_path: bool, inputs_file: str = '') -> None:
     """Writes the compiled CWL files and their associated yml inputs files to disk.
 
@@ -69,10 +102,15 @@ def write_to_disk(rose_tree: RoseTree, path: Path, relative_run_path: bool, inpu
         with open(inputs_file, mode='r', encoding='utf-8') as f:
             inputs = yaml.safe_load(f.read())
         for key, val in inputs.items():
-            if 'location' in val and not Path(val['location']).is_absolute():
+            if not isinstance(val, dict):
+                continue
+            loc = val.get('location')
+            # NOTE: Use PurePath (not os.path.isabs) so that root-relative paths
+            # such as /data/x are still considered relative on Windows.
+            if loc is not None and not PurePath(loc).is_absolute():
                 # Change relative paths for class: File and class: Dir
                 # to be w.r.t. autogenerated/
-                val['location'] = '../' + val['location']
+                val['location'] = '../' + loc
     _write_to_disk(rose_tree, path, relative_run_path, inputs)
 
 
@@ -90,40 +128,67 @@ def _write_to_disk(rose_tree: RoseTree, path: Path, relative_run_path: bool, inp
         relative_run_path (bool): Controls whether to use subdirectories or just one directory.
         inputs (Yaml): Optional additional inputs
     """
-    node_data: NodeData = rose_tree.data
+    # Only the root directory may need its parents to be created.
+    path.mkdir(parents=True, exist_ok=True)
+    created_dirs: Set[Path] = {path}
+    # Use an explicit queue instead of recursion so that deeply nested
+    # subworkflows cannot hit the recursion limit.
+    queue: Deque[Tuple[RoseTree, Path]] = deque([(rose_tree, path)])
+    while queue:
+        tree, tree_path = queue.popleft()
+
+        # With relative_run_path=False, every node is written to the same directory,
+        # so only call mkdir once per unique directory. Parents are always dequeued
+        # before their children, so the parent directory already exists and we can
+        # skip the parents=True walk.
+        if tree_path not in created_dirs:
+            tree_path.mkdir(exist_ok=True)
+            created_dirs.add(tree_path)
+
+        _write_node_to_disk(tree.data, tree_path, relative_run_path, inputs)
+
+        for sub_rose_tree in tree.sub_trees:
+            subpath = tree_path
+            if relative_run_path:
+                sub_node_data: NodeData = sub_rose_tree.data
+                sub_step_name = sub_node_data.namespaces[-1]
+                subpath = tree_path / sub_step_name
+            queue.append((sub_rose_tree, subpath))
+
+
+def _write_node_to_disk(node_data: NodeData, path: Path, relative_run_path: bool, inputs: Yaml) -> None:
+    """Writes the compiled CWL file and associated yml inputs file of a single node to disk.
+
+    Args:
+        node_data (NodeData): The data associated with a single compiled (sub)workflow
+        path (Path): The (existing) directory in which to write the files
+        relative_run_path (bool): Controls whether to use subdirectories or just one directory.
+        inputs (Yaml): Optional additional inputs
+    """
     namespaces = node_data.namespaces
     yaml_stem = node_data.name
     cwl_tree = node_data.compiled_cwl
-    yaml_inputs = {**node_data.workflow_inputs_file, **inputs}
+    # Only copy when there are additional inputs to merge (the common case is none).
+    yaml_inputs = {**node_data.workflow_inputs_file, **inputs} if inputs else node_data.workflow_inputs_file
 
-    path.mkdir(parents=True, exist_ok=True)
     if relative_run_path:
         filename_cwl = f'{yaml_stem}.cwl'
         filename_yml = f'{yaml_stem}_inputs.yml'
     else:
-        filename_cwl = '___'.join(namespaces + [f'{yaml_stem}.cwl'])
-        filename_yml = '___'.join(namespaces + [f'{yaml_stem}_inputs.yml'])
+        # Join the (shared) namespaces prefix once for both filenames.
+        ns_prefix = '___'.join(namespaces) + '___' if namespaces else ''
+        filename_cwl = f'{ns_prefix}{yaml_stem}.cwl'
+        filename_yml = f'{ns_prefix}{yaml_stem}_inputs.yml'
 
     # Dump the compiled CWL file contents to disk.
-    # Use sort_keys=False to preserve the order of the steps.
-    yaml_content = yaml.dump(cwl_tree, sort_keys=False, line_break='\n', indent=2, Dumper=NoAliasDumper)
-    with open(path / filename_cwl, mode='w', encoding='utf-8') as w:
-        w.write('#!/usr/bin/env cwl-runner\n')
-        w.write(auto_gen_header)
-        w.write(''.join(yaml_content))
-
-    yaml_content = yaml.dump(yaml_inputs, sort_keys=False, line_break='\n', indent=2, Dumper=NoAliasDumper)
-    with open(path / filename_yml, mode='w', encoding='utf-8') as inp:
-        inp.write(auto_gen_header)
-        inp.write(yaml_content)
-
-    for sub_rose_tree in rose_tree.sub_trees:
-        subpath = path
-        if relative_run_path:
-            sub_node_data: NodeData = sub_rose_tree.data
-            sub_step_name = sub_node_data.namespaces[-1]
-            subpath = path / sub_step_name
-        _write_to_disk(sub_rose_tree, subpath, relative_run_path, inputs)
+    # Stream directly into the file rather than materializing the yaml string.
+    with open(path / filename_cwl, mode='wb', buffering=BUFFER_SIZE) as w:
+        w.write(_CWL_PREAMBLE)
+        yaml.dump(cwl_tree, w, **_DUMPER_KWARGS)
+
+    with open(path / filename_yml, mode='wb', buffering=BUFFER_SIZE) as inp:
+        inp.write(_YML_PREAMBLE)
+        yaml.dump(yaml_inputs, inp, **_DUMPER_KWARGS)
 
 
 def write_config_to_disk(config: Json, config_file: Path) -> None:
@@ -136,36 +201,43 @@ def write_config_to_disk(config: Json, config_file: Path) -> None:
     config_dir = Path(config_file).parent
     # make the full path if it doesn't exist
     config_dir.mkdir(parents=True, exist_ok=True)
-    with open(config_file, 'w', encoding='utf-8') as f:
-        json.dump(config, f)
+    with open(config_file, 'w', encoding='utf-8', buffering=BUFFER_SIZE) as f:
+        json.dump(config, f, ensure_ascii=False)
 
 
-def get_config(config_file: Path, default_config_file: Path) -> Json:
+def get_config(config_file: Union[str, 'os.PathLike[str]'],
+               default_config_file: Union[str, 'os.PathLike[str]']) -> Json:
     """Returns the config json object from config_file with absolute paths
 
     Args:
-        config_file (Path): The path of the user specified config file
-        default_config_file (Path): The default path of the config file if user hasn't specified one
+        config_file (Union[str, os.PathLike[str]]): The path of the user specified config file
+        default_config_file (Union[str, os.PathLike[str]]): The default path if user hasn't specified one
+
+    Raises:
+        OSError: If config_file exists, but is not a regular file (e.g. it is a directory)
 
     Returns:
         Json: The config json object with absolute filepaths
     """
     global_config: Json = {}
-    if not config_file.exists():
-        if config_file == default_config_file:
-            global_config = get_default_config()
-            # write the default config object to the 'global_config.json' file in user's ~/wic directory
-            # for user to inspect and or modify the config json file
-            write_config_to_disk(global_config, default_config_file)
-            print(f'default config file : {default_config_file} generated')
-        else:
-            print(f"Error user specified config file {config_file} doesn't exist")
-            sys.exit()
-    else:
+    config_path = os.fspath(config_file)
+    # NOTE: os.path.isfile is a single stat call, without the Path.exists() machinery
+    if os.path.isfile(config_path):
         # reading user specified config file only if it exists
         # never overwrite user's config file or generate another file in user's non-default directory
         # TODO : Validate the json inside 'read_config_from_disk' function
-        global_config = read_config_from_disk(config_file)
+        global_config = read_config_from_disk(Path(config_path))
+    elif os.path.exists(config_path):
+        raise OSError(f"Error config file {config_file} exists but is not a file")
+    elif Path(config_path) == Path(default_config_file):
+        global_config = get_default_config()
+        # write the default config object to the 'global_config.json' file in user's ~/wic directory
+        # for user to inspect and or modify the config json file
+        write_config_to_disk(global_config, Path(default_config_file))
+        print(f'default config file : {default_config_file} generated')
+    else:
+        print(f"Error user specified config file {config_file} doesn't exist")
+        sys.exit()
     return global_config
 
 
@@ -175,6 +247,32 @@ def read_config_from_disk(config_file: Path) -> Json:
     Args:
         config_file (Path): The path of json file where it is to be read from
 
+    Returns:
+        Json: The config json object with absolute filepaths
+    """
+    # The same config file is typically read many times (e.g. once per call to
+    # compile() in the python API), so cache the parsed result. The relative
+    # paths are resolved w.r.t. the cwd, so it must also be part of the key.
+    # NOTE: The mtime alone is not enough to detect rewrites (i.e. on filesystems
+    # with coarse mtime resolution, or tools which preserve the mtime).
+    config_path = Path(config_file).resolve()
+    stat = os.stat(config_path)
+    file_id = (stat.st_ino, stat.st_size, stat.st_mtime_ns)
+    config = _read_config_from_disk(config_path, file_id, os.getcwd())
+    # Return a copy so that callers can still freely mutate their config.
+    return copy.deepcopy(config)
+
+
+@functools.lru_cache(maxsize=8)
+def _read_config_from_disk(config_file: Path, file_id: Tuple[int, int, int],  # pylint: disable=unused-argument
+                           cwd: str) -> Json:
+    """Returns the config json object from config_file with absolute paths
+
+    Args:
+        config_file (Path): The (resolved) path of json file where it is to be read from
+        file_id (Tuple[int, int, int]): The (st_ino, st_size, st_mtime_ns) of config_file; used to invalidate the cache
+        cwd (str): The current working directory, w.r.t. which relative paths are resolved
+
     Returns:
         Json: The config json object with absolute filepaths
     """
@@ -184,7 +282,7 @@ def read_config_from_disk(config_file: Path) -> Json:
         config = json.load(f)
     conf_tags = ['search_paths_cwl', 'search_paths_wic']
     for tag in conf_tags:
-        config[tag] = get_absolute_paths(config[tag])
+        config[tag] = get_absolute_paths(config[tag], cwd)
     return config
 
 
@@ -202,20 +300,33 @@ def get_default_config() -> Json:
     return default_config
 
 
-def get_absolute_paths(sub_config: Json) -> Json:
+@functools.lru_cache(maxsize=None)
+def _absolute_path(path: str, cwd: str) -> str:
+    """Memoized equivalent of str(Path(path).absolute()) w.r.t. cwd
+
+    Args:
+        path (str): An absolute or relative filepath
+        cwd (str): The current working directory, i.e. os.getcwd()
+
+    Returns:
+        str: The absolute filepath
+    """
+    # NOTE: cwd is part of the cache key, so changing directories is safe.
+    return str(Path(cwd, path))
+
+
+def get_absolute_paths(sub_config: Json, cwd: str) -> Json:
     """Update the paths within the sub_config json object as absolute paths
 
     Args:
         sub_config (dict): The json (sub)object where filepaths are stored
+        cwd (str): The directory w.r.t. which relative filepaths are resolved
 
     Returns:
         Json: The json (sub)object with absolute filepaths
     """
-    abs_sub_config = copy.deepcopy(sub_config)
-    for ns in abs_sub_config:
-        abs_paths = [str(Path(path).absolute()) for path in abs_sub_config[ns]]
-        abs_sub_config[ns] = abs_paths
-    return abs_sub_config
+    # Every value is replaced, so build a fresh dict instead of deepcopying.
+    return {ns: [_absolute_path(path, cwd) for path in paths] for ns, paths in sub_config.items()}
 
 
 def write_absolute_yaml_tags(args: argparse.Namespace, in_dict_in: Yaml, namespaces: Namespaces,
@@ -232,11 +343,12 @@ def write_absolute_yaml_tags(args: argparse.Namespace, in_dict_in: Yaml, namespa
 
     # cachedir_path needs to be an absolute path, but for reproducibility
     # we don't want users' home directories in the yml files.
-    cachedir_path = Path(args.cachedir).absolute()
+    cwd = os.getcwd()
+    cachedir_path = _absolute_path(str(args.cachedir), cwd)
     # print('setting cachedir_path to', cachedir_path)
-    in_dict_in['root_workflow_yml_path'] = {'wic_inline_input': str(Path(args.yaml).parent.absolute())}
+    in_dict_in['root_workflow_yml_path'] = {'wic_inline_input': _absolute_path(str(Path(args.yaml).parent), cwd)}
 
-    in_dict_in['cachedir_path'] = {'wic_inline_input': str(cachedir_path)}
+    in_dict_in['cachedir_path'] = {'wic_inline_input': cachedir_path}
     in_dict_in['homedir'] = {'wic_inline_input': args.homedir}
 
     # Add a 'dummy' values to explicit_edge_calls, because
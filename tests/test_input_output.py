@@ -0,0 +1,59 @@
+import json
+import os
+from pathlib import Path
+
+import pytest
+
+import sophios.input_output as io
+from sophios.wic_types import Json
+
+
+def write_config(config_file: Path, config: Json) -> None:
+    """Writes config to config_file, preserving the previous mtime (if any)
+
+    Args:
+        config_file (Path): The path of the config file
+        config (Json): The config json object
+    """
+    mtime_ns = config_file.stat().st_mtime_ns if config_file.exists() else None
+    config_file.write_text(json.dumps(config), encoding='utf-8')
+    if mtime_ns is not None:
+        # Simulate a coarse mtime resolution / a tool which preserves the mtime.
+        os.utime(config_file, ns=(mtime_ns, mtime_ns))
+
+
+@pytest.mark.fast
+def test_read_config_from_disk_rewrite(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Tests that rewriting the config file invalidates the cache, even if the mtime is unchanged"""
+    monkeypatch.chdir(tmp_path)
+    config_file = tmp_path / 'config.json'
+    write_config(config_file, {'search_paths_cwl': {'global': ['a']}, 'search_paths_wic': {}})
+    assert io.read_config_from_disk(config_file)['search_paths_cwl'] == {'global': [str(tmp_path / 'a')]}
+
+    write_config(config_file, {'search_paths_cwl': {'global': ['abc']}, 'search_paths_wic': {}})
+    assert io.read_config_from_disk(config_file)['search_paths_cwl'] == {'global': [str(tmp_path / 'abc')]}
+
+
+@pytest.mark.fast
+def test_read_config_from_disk_cwd(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Tests that relative paths are resolved w.r.t. the current cwd, not the cwd of a cached read"""
+    config_file = tmp_path / 'config.json'
+    write_config(config_file, {'search_paths_cwl': {}, 'search_paths_wic': {'global': ['a']}})
+    for subdir in ['x', 'y']:
+        (tmp_path / subdir).mkdir()
+        monkeypatch.chdir(tmp_path / subdir)
+        assert io.read_config_from_disk(config_file)['search_paths_wic'] == {'global': [str(tmp_path / subdir / 'a')]}
+
+
+@pytest.mark.fast
+def test_read_config_from_disk_mutation(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Tests that mutating a returned config does not affect subsequent reads"""
+    monkeypatch.chdir(tmp_path)
+    config_file = tmp_path / 'config.json'
+    write_config(config_file, {'search_paths_cwl': {'global': ['a']}, 'search_paths_wic': {}})
+    config = io.read_config_from_disk(config_file)
+    config['search_paths_cwl']['global'].append('b')
+    config['search_paths_wic']['global'] = ['c']
+
+    config = io.read_config_from_disk(config_file)
+    assert config == {'search_paths_cwl': {'global': [str(tmp_path / 'a')]}, 'search_paths_wic': {}}